@@ -0,0 +1,461 @@
+"""Headless benchmarks for TheToolBox: ζ engine, zero finder, renderers, notes storage
+
+Runs without a display: the renderers draw on RecordingCanvas, a stand-in
+that counts canvas calls.  With --tk they also draw on a real Tk canvas,
+using $DISPLAY or a private Xvfb when one is installed.
+
+    python bench_toolbox.py                    # run, compare with bench_baseline.json
+    python bench_toolbox.py --quick            # smaller sizes, a few seconds
+    python bench_toolbox.py --save-baseline    # make this run the new baseline
+
+These are benchmarks, not tests: timings depend on the machine, so compare
+baselines taken on the same box.
+"""
+import argparse
+import bisect
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import TheToolBox as box
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REFERENCE_ZEROS = os.path.join(HERE, 'zeros_reference.txt')
+BASELINE = os.path.join(HERE, 'bench_baseline.json')
+
+# ─── Canvas stand-ins ──────────────────────────────────────────
+class RecordingCanvas:
+    """Enough of tk.Canvas for the renderers; counts every call instead of drawing"""
+    def __init__(self, width=400, height=600):
+        self.width = width
+        self.height = height
+        self.items = {}
+        self.next_id = 0
+        self.calls = 0
+
+    def _create(self, *coords, **options):
+        self.calls += 1
+        self.next_id += 1
+        self.items[self.next_id] = dict(options)
+        return self.next_id
+
+    create_text = create_line = create_oval = create_image = create_rectangle = _create
+
+    def itemcget(self, item, option):
+        return self.items[item].get(option, "")
+
+    def itemconfig(self, item, **options):
+        self.calls += 1
+        if item in self.items:
+            self.items[item].update(options)
+
+    def coords(self, item, *coords):
+        self.calls += 1
+
+    def move(self, tag, dx, dy):
+        self.calls += 1
+
+    def delete(self, *items):
+        self.calls += 1
+        for item in items:
+            self.items.pop(item, None)
+
+    def find_all(self):
+        return tuple(self.items)
+
+    def winfo_exists(self):
+        return True
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+_xvfb = None
+
+def tk_canvas(width=400, height=600):
+    """A real canvas on $DISPLAY, or on a private Xvfb; None when neither is available"""
+    global _xvfb
+    import tkinter as tk
+    if not os.environ.get('DISPLAY') and shutil.which('Xvfb'):
+        _xvfb = subprocess.Popen(['Xvfb', ':97', '-screen', '0', '1024x768x24'],
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        os.environ['DISPLAY'] = ':97'
+        time.sleep(0.5)
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    root.geometry(f"{width}x{height}")
+    canvas = tk.Canvas(root, width=width, height=height, bg="#000000", highlightthickness=0)
+    canvas.pack()
+    root.update()
+    return canvas
+
+def best_of(func, repeat=5):
+    """Fastest of `repeat` calls, in ms; the minimum is the least noisy estimate"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+def _frames(step, count, canvas):
+    """Mean ms and canvas calls per frame over `count` calls of step()
+
+    The p95 is recorded but not compared (no _ms suffix): at these
+    sub-millisecond times it mostly measures scheduler noise.
+    """
+    times = []
+    calls = getattr(canvas, 'calls', 0)
+    for _ in range(count):
+        start = time.perf_counter()
+        step()
+        if not isinstance(canvas, RecordingCanvas):
+            canvas.update_idletasks()  # include Tk's redraw
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    result = {'frame_mean_ms': sum(times) / count, 'frame_p95': times[int(0.95 * count)]}
+    if isinstance(canvas, RecordingCanvas):
+        result['canvas_calls_per_frame'] = (canvas.calls - calls) / count
+        result['canvas_items'] = len(canvas.items)
+    return result
+
+# ─── Benchmarks ────────────────────────────────────────────────
+def bench_zeta_accurate(quick):
+    """zeta_accurate() evaluations per second at several heights and precisions"""
+    results = {}
+    heights = (10, 1000) if quick else (10, 100, 1000, 10000)
+    count = 20 if quick else 100
+    saved = box.mp.dps
+    try:
+        for dps in (15, 30) if quick else (15, 30, 50):
+            box.mp.dps = dps
+            for t in heights:
+                rng = random.Random(t)
+                points = [t + rng.random() for _ in range(count)]
+                start = time.perf_counter()
+                for x in points:
+                    box.zeta_accurate(0.5, x)
+                elapsed = time.perf_counter() - start
+                results[f"t{t}_dps{dps}"] = {'evals_per_s': count / elapsed}
+    finally:
+        box.mp.dps = saved
+    return results
+
+def load_reference(limit=None):
+    """Zero ordinates from zeros_reference.txt, in order, as the 25-digit strings"""
+    zeros = []
+    with open(REFERENCE_ZEROS, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('#') or not line.strip():
+                continue
+            zeros.append(line.split()[1])
+            if limit and len(zeros) >= limit:
+                break
+    return zeros
+
+ZEROS_DPS = 20
+
+def zero_tolerance(dps):
+    """Relative error allowed for a zero refined to dps digits: 1e-12 at 20 digits
+
+    Eight digits of slack cover the refinement's stopping rule; a bracket
+    that missed its root is off by far more.
+    """
+    return 10.0 ** (8 - dps)
+
+def bench_zeros(quick):
+    """find_zeros_detailed() against the bundled reference list and KNOWN_ZEROS
+
+    Correctness is pass/fail, not a timing: every reference zero must be
+    found within zero_tolerance(), and nothing else found.
+    """
+    with box.mp.workdps(30):
+        reference = [box.mp.mpf(t) for t in load_reference(101 if quick else None)]
+    # End halfway to the next reference zero so the last one is well inside
+    t_end = float((reference[-1] + reference[-2]) / 2)
+    reference = reference[:-1]
+    start = time.perf_counter()
+    found = box.find_zeros_detailed(0.0, t_end, ZEROS_DPS)
+    elapsed = time.perf_counter() - start
+
+    heights = [zero['t'] for zero in found]
+    tolerance = zero_tolerance(ZEROS_DPS)
+    failures = []
+    matched = set()
+    worst = 0.0
+    with box.mp.workdps(30):
+        for n, t in enumerate(reference, 1):
+            i = bisect.bisect_left(heights, float(t))
+            near = [j for j in (i - 1, i) if 0 <= j < len(found)]
+            j = min(near, key=lambda j: abs(heights[j] - float(t)), default=None)
+            if j is None or abs(heights[j] - float(t)) > 1e-3:
+                failures.append(f"zero #{n} at {box.mp.nstr(t, 20)} not found")
+                continue
+            matched.add(j)
+            error = float(abs(found[j]['root'] - t) / t)
+            worst = max(worst, error)
+            if error > tolerance:
+                failures.append(f"zero #{n}: {box.mp.nstr(found[j]['root'], 20)} vs "
+                                f"{box.mp.nstr(t, 20)}, relative error {error:.1e}")
+    failures += [f"extra zero at {heights[j]!r}" for j in range(len(found)) if j not in matched]
+    if not all(any(abs(h - k) < 1e-5 for h in heights) for k in box.KNOWN_ZEROS):
+        failures.append("a KNOWN_ZEROS entry was not found")
+    return {'lehmer_pair': bench_lehmer_pair(), 'range': {
+        't_end': t_end,
+        'dps': ZEROS_DPS,
+        'expected': len(reference),
+        'found': len(found),
+        'tolerance_rel': tolerance,
+        'max_rel_error': worst,
+        'failures': failures,
+        'seconds_s': elapsed,
+        'zeros_per_s': len(found) / elapsed,
+    }}
+
+# Lehmer's close pair, and a range narrower than the Gram block holding it
+LEHMER_PAIR = ('7005.062866175', '7005.100564674')
+LEHMER_RANGE = (7004.5, 7005.5)
+
+def bench_lehmer_pair():
+    """find_zeros() and iter_zeros() on a sub-block range must both find Lehmer's pair"""
+    failures = []
+    start = time.perf_counter()
+    found = {
+        'find_zeros': [float(t) for t in box.find_zeros(*LEHMER_RANGE, ZEROS_DPS)],
+        'iter_zeros': [zero['t'] for zero in box.iter_zeros(*LEHMER_RANGE, ZEROS_DPS)],
+    }
+    elapsed = time.perf_counter() - start
+    expected = [float(t) for t in LEHMER_PAIR]
+    for name, heights in found.items():
+        if len(heights) != len(expected) or \
+                any(abs(h - t) > 1e-8 for h, t in zip(heights, expected)):
+            failures.append(f"{name}{LEHMER_RANGE} gave {heights}, expected {expected}")
+    return {'failures': failures, 'seconds_s': elapsed}
+
+def bench_render(quick, use_tk):
+    """Per-frame cost of the matrix rain and the zeta trail"""
+    results = {}
+    frames = 200 if quick else 3000
+    canvases = [('fake', RecordingCanvas)]
+    if use_tk:
+        canvas = tk_canvas()
+        if canvas is None:
+            print("no display and no Xvfb: skipping the Tk canvas runs", file=sys.stderr)
+        else:
+            canvases.append(('tk', lambda: canvas))
+
+    for kind, make in canvases:
+        canvas = make()
+        random.seed(1)
+        rain = box.MatrixRain(canvas, 400, 600)
+        results[f"matrix_rain_{kind}"] = _frames(rain.step, frames, canvas)
+        if kind == 'tk':
+            canvas.delete("all")
+
+        for capacity in (500, 10000):
+            canvas = make()
+            trail = box.ZetaTrail(canvas, capacity)
+            state = {'k': 0}
+
+            def step():
+                k = state['k'] = state['k'] + 1
+                trail.append(180 + 80 * box.math.cos(k / 40), 100 + 80 * box.math.sin(k / 23), k)
+                trail.draw_head(180, 100, k % 50 == 0, 25)
+
+            # Fill the ring first so the measured frames recycle segments
+            for _ in range(capacity):
+                step()
+            results[f"zeta_trail_{capacity}_{kind}"] = _frames(step, frames, canvas)
+            if kind == 'tk':
+                canvas.delete("all")
+    return results
+
+def bench_notes(quick):
+    """Notes storage at growing sizes: full rewrite vs journaled edit, and load"""
+    results = {}
+    sizes = (10_000, 100_000, 1_000_000) if quick else (10_000, 100_000, 1_000_000, 10_000_000)
+    line = "the quick brown fox jumps over the lazy dog 0123456789\n"
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"notes_{size}.txt")
+            text = line * (size // len(line))
+            lines = text.count("\n")
+
+            rewrite_ms = best_of(lambda: box.write_atomic(path, text))
+
+            journal = box.NotesJournal(path)
+            journal.load()
+            edits = 50
+            start = time.perf_counter()
+            for k in range(edits):
+                journal.pending.append(('i', f"{1 + k * lines // edits}.0", "edit "))
+                journal.flush()
+            edit_ms = (time.perf_counter() - start) * 1000 / edits
+
+            load_ms = best_of(lambda: box.NotesJournal(path).load())
+            assert len(box.NotesJournal(path).load()) == len(text) + 5 * edits
+
+            results[f"size_{size}"] = {'full_rewrite_ms': rewrite_ms,
+                                       'journaled_edit_ms': edit_ms,
+                                       'load_with_journal_ms': load_ms}
+    return results
+
+def notes_text(size, seed=0):
+    """About `size` characters of lines drawn from a Zipf-like vocabulary, like real notes"""
+    rng = random.Random(seed)
+    vocabulary = [f"w{k}" for k in range(20000)]
+    weights = [1 / (k + 1) for k in range(len(vocabulary))]
+    words = rng.choices(vocabulary, weights, k=size // 4)
+    lines = []
+    length = 0
+    while words and length < size:
+        line = " ".join(words[-rng.randint(1, 12):])
+        del words[-12:]
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+def bench_notes_search(quick):
+    """Notes index: load from its file, one edit, and queries as typed"""
+    results = {}
+    sizes = (100_000, 1_000_000) if quick else (100_000, 1_000_000, 10_000_000)
+    queries = {'rare': "w12345", 'common': "w1 ", 'prefix': "w12", 'two_words': "w7 w300"}
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"notes_{size}.txt.index")
+            text = notes_text(size)
+            lines = text.split("\n")
+            start = time.perf_counter()
+            index = box.NotesIndex(path)
+            index.build(lines)
+            build_ms = (time.perf_counter() - start) * 1000
+            box.NotesIndex.write(path, text, 0)
+            load_ms = best_of(lambda: box.NotesIndex(path).load(text, 0))
+
+            middle = f"{len(lines) // 2}.0"
+            edit_ms = best_of(lambda: index.apply(('i', middle, "w42 ")))
+            result = {'build_ms': build_ms, 'index_load_ms': load_ms, 'index_edit_ms': edit_ms}
+            for name, query in queries.items():
+                index.search(query)  # decode the postings once, as the first keystroke would
+                result[f"search_{name}_ms"] = best_of(lambda: index.search(query))
+            results[f"size_{size}"] = result
+    return results
+
+BENCHMARKS = {
+    'zeta_accurate': lambda args: bench_zeta_accurate(args.quick),
+    'zeros': lambda args: bench_zeros(args.quick),
+    'render': lambda args: bench_render(args.quick, args.tk),
+    'notes': lambda args: bench_notes(args.quick),
+    'notes_search': lambda args: bench_notes_search(args.quick),
+}
+
+# ─── Baselines ─────────────────────────────────────────────────
+def better(metric):
+    """+1 if higher is better, -1 if lower is better, 0 if not compared"""
+    if metric.endswith('_per_s'):
+        return 1
+    if metric.endswith(('_ms', '_s')):
+        return -1
+    return 0
+
+def compare(results, baseline, tolerance):
+    """Print metric-by-metric changes; returns the number of regressions past tolerance"""
+    regressions = 0
+    for group, cases in results['results'].items():
+        for case, metrics in cases.items():
+            old = baseline.get('results', {}).get(group, {}).get(case, {})
+            for metric, value in metrics.items():
+                direction = better(metric)
+                before = old.get(metric)
+                if not direction or not isinstance(value, (int, float)) or \
+                        not isinstance(before, (int, float)):
+                    continue
+                if before == 0:
+                    worse = value > 0 if direction < 0 else False
+                    change = 0.0
+                else:
+                    change = (value - before) / abs(before)
+                    worse = direction * change < -tolerance
+                flag = "REGRESSION" if worse else ""
+                regressions += worse
+                print(f"{group}.{case}.{metric}: {before:.4g} -> {value:.4g} "
+                      f"({change:+.0%}) {flag}".rstrip())
+    return regressions
+
+def failures(results):
+    """Correctness failures the benchmarks reported; these fail a run outright"""
+    return [f"{group}.{case}: {failure}"
+            for group, cases in results['results'].items()
+            for case, metrics in cases.items()
+            for failure in metrics.get('failures', ())]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="smaller sizes and fewer repeats")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), metavar="NAME",
+                        help=f"run only these groups: {', '.join(sorted(BENCHMARKS))}")
+    parser.add_argument("--tk", action="store_true",
+                        help="also render on a real Tk canvas ($DISPLAY or Xvfb)")
+    parser.add_argument("--output", "-o", default=os.path.join(HERE, 'bench_results.json'),
+                        help="where to write this run's results")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline to compare with")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write this run to the baseline file instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="relative change that counts as a regression (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    box.load_math()
+    results = {
+        'meta': {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': getattr(box.np, '__version__', None),
+            'mpmath': sys.modules['mpmath'].__version__,
+            'zeta_backend': box.zeta_backend.name,
+            'quick': args.quick,
+        },
+        'results': {},
+    }
+    for name in args.only or BENCHMARKS:
+        start = time.perf_counter()
+        results['results'][name] = BENCHMARKS[name](args)
+        print(f"{name}: {time.perf_counter() - start:.1f} s", file=sys.stderr)
+
+    failed = failures(results)
+    path = args.baseline if args.save_baseline and not failed else args.output
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=1)
+    print(f"results written to {path}", file=sys.stderr)
+    if _xvfb:
+        _xvfb.terminate()
+
+    if failed:
+        for failure in failed:
+            print(f"FAILED {failure}", file=sys.stderr)
+        return 1
+    if args.save_baseline or not os.path.exists(args.baseline):
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('meta', {}).get('quick') != args.quick:
+        print("baseline was taken with a different --quick setting; not comparing",
+              file=sys.stderr)
+        return 0
+    regressions = compare(results, baseline, args.tolerance)
+    print(f"{regressions} regression(s) beyond {args.tolerance:.0%}", file=sys.stderr)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())